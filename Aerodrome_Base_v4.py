@@ -9,18 +9,25 @@ Streamlit dashboard for Aerodrome pools on Base:
 """
 
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import requests
 import streamlit as st
+from eth_abi import encode as abi_encode
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from web3 import Web3
 
 from pool_events_reader import (
+    RecentActivity,
+    _checksum,
     get_recent_activity,
     get_liquidity_timeseries,
     get_swap_volume_timeseries,
@@ -31,6 +38,51 @@ from pool_events_reader import (
 DEXSCREENER_PAIR_URL = "https://api.dexscreener.com/latest/dex/pairs"
 DEXSCREENER_TOKEN_URL = "https://api.dexscreener.com/latest/dex/tokens"
 
+# Upper bound on concurrent DexScreener requests per rerun
+MAX_FETCH_WORKERS = 16
+
+# DexScreener accepts up to 30 comma-separated pair addresses per request
+DEXSCREENER_MAX_PAIRS = 30
+
+# Per-pool snapshot freshness (seconds): TTL = PAIR_TTL_VOLUME_SCALE / volume_24h_usd,
+# so a $1M/day pool refreshes every ~4s -> clamped to 30s, a $10k/day pool every 360s
+PAIR_TTL_MIN = 30
+PAIR_TTL_MAX = 600
+PAIR_TTL_VOLUME_SCALE = 3_600_000
+PAIR_TTL_MISSING = 60
+
+# Explicit dtypes for the numeric snapshot columns. Secondary volume windows
+# and trade counts are narrowed; price, USD totals and fees stay float64
+# since they are summed or printed verbatim.
+SNAPSHOT_DTYPES = {
+    "price_usd": "float64",
+    "liquidity_usd": "float64",
+    "liquidity_token0": "float64",
+    "liquidity_token1": "float64",
+    "volume_24h_usd": "float64",
+    "volume_6h_usd": "float32",
+    "volume_1h_usd": "float32",
+    "tx_24h_count": "int32",
+    "tx_6h_count": "int32",
+    "tx_1h_count": "int32",
+    "fee_stable_pct": "float64",
+    "fee_volatile_pct": "float64",
+}
+
+# Overview table columns, in display order
+OVERVIEW_COLUMN_CONFIG = {
+    "pair_name": st.column_config.TextColumn("Pair"),
+    "pair_address": st.column_config.TextColumn("Address"),
+    "token0_symbol": st.column_config.TextColumn("Token A"),
+    "liquidity_token0": st.column_config.NumberColumn("Token A Balance"),
+    "token1_symbol": st.column_config.TextColumn("Token B"),
+    "liquidity_token1": st.column_config.NumberColumn("Token B Balance"),
+    "liquidity_usd": st.column_config.NumberColumn("Total Liq. (USD)", format="$%.0f"),
+    "volume_24h_usd": st.column_config.NumberColumn("Vol. 24h (USD)", format="$%.0f"),
+    "tx_24h_count": st.column_config.NumberColumn("Trades 24h"),
+    "fee_stable_pct": st.column_config.NumberColumn("Stable Fee %"),
+}
+
 BASE_RPC_URL = "https://mainnet.base.org"  # not strictly needed for UI, but kept for future on-chain calls
 FACTORY_ADDRESS = Web3.to_checksum_address("0x420dd381b31aef6683db6b902084cb0ffece40da")
 
@@ -58,80 +110,250 @@ FACTORY_ABI = [
     },
 ]
 
+MULTICALL3_ADDRESS = Web3.to_checksum_address("0xcA11bde05977b3631167028862bE2a173976CA11")
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+GET_FEE_SELECTOR = Web3.keccak(text="getFee(address,bool)")[:4]
+
 
 class AerodromeFees:
     def __init__(self, basescan_key: str = ""):
         self.basescan_key = basescan_key
         self.w3 = Web3(Web3.HTTPProvider(BASE_RPC_URL))
-        self.factory = self.w3.eth.contract(address=FACTORY_ADDRESS, abi=FACTORY_ABI)
-
-    @st.cache_data(ttl=300)
-    def get_default_fees(_self) -> Dict[str, float]:
+        self.multicall = self.w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+    def fetch_all_fees(
+        self, pool_addresses: List[str]
+    ) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """
+        Fetch (stable, volatile) fees for every pool in one Multicall3 eth_call.
+        Keys are lowercase pool addresses; failed sub-calls map to None.
+        """
+        calls = []
+        for addr in pool_addresses:
+            checksum = _checksum(addr)
+            for is_stable in (True, False):
+                call_data = GET_FEE_SELECTOR + abi_encode(["address", "bool"], [checksum, is_stable])
+                calls.append((FACTORY_ADDRESS, True, call_data))
         try:
-            volatile = _self.factory.functions.volatileFee().call() / 10000
-            stable = _self.factory.functions.stableFee(True).call() / 10000
-            return {"stable": round(stable, 4), "volatile": round(volatile, 4)}
+            results = self.multicall.functions.aggregate3(calls).call()
         except Exception:
-            return {"stable": 0.05, "volatile": 0.30}
+            return {}
+
+        def decode(result) -> Optional[float]:
+            success, data = result
+            if not success or len(data) < 32:
+                return None
+            return round(int.from_bytes(data[:32], "big") / 10000, 4)
+
+        return {
+            addr.lower(): (decode(results[2 * i]), decode(results[2 * i + 1]))
+            for i, addr in enumerate(pool_addresses)
+        }
 
-    def get_pool_fee(self, pool_address: str, is_stable: bool = False) -> Optional[float]:
-        try:
-            fee_bps = self.factory.functions.getFee(
-                Web3.to_checksum_address(pool_address), is_stable
-            ).call()
-            return round(fee_bps / 10000, 4)
-        except Exception:
-            return None
+
+@st.cache_data(ttl=300)
+def get_default_fees_cached(rpc_url: str) -> Dict[str, float]:
+    try:
+        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        factory = w3.eth.contract(address=FACTORY_ADDRESS, abi=FACTORY_ABI)
+        volatile = factory.functions.volatileFee().call() / 10000
+        stable = factory.functions.stableFee(True).call() / 10000
+        return {"stable": round(stable, 4), "volatile": round(volatile, 4)}
+    except Exception:
+        return {"stable": 0.05, "volatile": 0.30}
+
+
+@st.cache_resource
+def get_fee_client(basescan_key: str = "") -> AerodromeFees:
+    # Reused across reruns so the Web3 HTTP session stays warm
+    return AerodromeFees(basescan_key)
 
 
 # ---------- HELPERS ----------
 
+@st.cache_resource(show_spinner=False)
+def get_http_session() -> requests.Session:
+    # One keep-alive session for the whole process, so TCP/TLS connections
+    # survive reruns; transient failures are retried by the adapter.
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=MAX_FETCH_WORKERS,
+            pool_maxsize=MAX_FETCH_WORKERS,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+_ADDR_RE = re.compile(r"^0x[a-fA-F0-9]{40}$")
+
 
 def is_valid_address(addr: str) -> bool:
-    return bool(re.match(r"^0x[a-fA-F0-9]{40}$", addr))
+    return _ADDR_RE.match(addr) is not None
 
 
-@st.cache_data(ttl=60)
-def fetch_pair(chain: str, pool_address: str, max_retries: int = 2) -> Optional[dict]:
-    url = f"{DEXSCREENER_PAIR_URL}/{chain}/{pool_address}"
-    for attempt in range(max_retries + 1):
-        try:
-            resp = requests.get(url, timeout=10)
-        except requests.RequestException:
-            if attempt == max_retries:
-                return None
-            time.sleep(1)
-            continue
-        if resp.status_code != 200:
-            if attempt == max_retries:
-                return None
-            time.sleep(1)
-            continue
-        data = resp.json()
-        pairs = data.get("pairs", [])
-        return pairs[0] if pairs else None
-    return None
+def fetch_pair_chunk(chain: str, pool_addresses: Tuple[str, ...]) -> Optional[Dict[str, dict]]:
+    """
+    Returns pairs keyed by lowercase address, or None if the request failed.
+    """
+    url = f"{DEXSCREENER_PAIR_URL}/{chain}/{','.join(pool_addresses)}"
+    try:
+        resp = get_http_session().get(url, timeout=10)
+    except requests.RequestException:
+        return None
+    if resp.status_code != 200:
+        return None
+    pairs = resp.json().get("pairs") or []
+    return {p["pairAddress"].lower(): p for p in pairs if p.get("pairAddress")}
+
+
+PairCache = Dict[Tuple[str, str], Tuple[Optional[dict], float]]
+
+
+@st.cache_resource
+def get_pair_cache() -> Tuple[PairCache, threading.Lock]:
+    """
+    (chain, lowercase pool address) -> (pair or None if unknown, expiry timestamp).
+    Shared across sessions; replaces a flat st.cache_data TTL so that quiet
+    pools are refreshed less often than busy ones. A cached resource rather
+    than a module global, since Streamlit re-executes this script as a fresh
+    module on every rerun.
+    """
+    return {}, threading.Lock()
+
+
+def pair_ttl(pair: Optional[dict]) -> float:
+    """
+    Seconds until a snapshot is refetched: inversely proportional to 24h volume,
+    clamped to [PAIR_TTL_MIN, PAIR_TTL_MAX].
+    """
+    if not pair:
+        return PAIR_TTL_MISSING
+    volume_24h = float((pair.get("volume") or {}).get("h24") or 0)
+    if volume_24h <= 0:
+        return PAIR_TTL_MAX
+    return max(PAIR_TTL_MIN, min(PAIR_TTL_MAX, PAIR_TTL_VOLUME_SCALE / volume_24h))
+
+
+def clear_pair_cache() -> None:
+    pair_cache, lock = get_pair_cache()
+    with lock:
+        pair_cache.clear()
+
+
+def fetch_pairs_bulk(chain: str, pool_addresses: List[str]) -> Dict[str, dict]:
+    """
+    Fetch pair snapshots keyed by lowercase pool address. Only pools whose
+    cached snapshot has expired are requested, up to DEXSCREENER_MAX_PAIRS
+    addresses per request, chunks in parallel.
+    """
+    pair_cache, lock = get_pair_cache()
+    now = time.time()
+    addrs = list(dict.fromkeys(a.lower() for a in pool_addresses))
+    with lock:
+        stale = [
+            a for a in addrs if pair_cache.get((chain, a), (None, 0.0))[1] <= now
+        ]
+    chunks = [
+        tuple(stale[i : i + DEXSCREENER_MAX_PAIRS])
+        for i in range(0, len(stale), DEXSCREENER_MAX_PAIRS)
+    ]
+    if chunks:
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(chunks))) as executor:
+            for chunk, result in zip(
+                chunks, executor.map(lambda c: fetch_pair_chunk(chain, c), chunks)
+            ):
+                if result is None:
+                    continue  # keep any previous snapshot, retry next rerun
+                with lock:
+                    for addr in chunk:
+                        pair = result.get(addr)
+                        pair_cache[(chain, addr)] = (pair, now + pair_ttl(pair))
+
+    pairs: Dict[str, dict] = {}
+    with lock:
+        for addr in addrs:
+            pair = pair_cache.get((chain, addr), (None, 0.0))[0]
+            if pair:
+                pairs[addr] = pair
+    return pairs
 
 
-@st.cache_data(ttl=300)
-def fetch_token_price_history(token_address: str, max_retries: int = 2) -> Optional[dict]:
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_token_price_history(token_address: str) -> Optional[dict]:
     url = f"{DEXSCREENER_TOKEN_URL}/{token_address}"
-    for attempt in range(max_retries + 1):
-        try:
-            resp = requests.get(url, timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
-                pairs = data.get("pairs", [])
-                return pairs[0] if pairs else None
-        except Exception:
-            if attempt < max_retries:
-                time.sleep(1)
-                continue
-            return None
+    try:
+        resp = get_http_session().get(url, timeout=10)
+        if resp.status_code == 200:
+            pairs = resp.json().get("pairs", [])
+            return pairs[0] if pairs else None
+    except Exception:
+        return None
     return None
 
 
-def build_dataframe_from_pair(pair: dict, fee_client: AerodromeFees) -> pd.DataFrame:
+# Cached reader wrappers: widget reruns (e.g. the log-scale toggle) reuse
+# results instead of re-querying SQLite for every pool.
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_recent_activity(pool_address: str, lookback_hours: int) -> RecentActivity:
+    return get_recent_activity(pool_address, lookback_hours=lookback_hours)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_liquidity_ts(pool_address: str, lookback_days: int) -> pd.DataFrame:
+    return get_liquidity_timeseries(pool_address, lookback_days=lookback_days)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_swap_volume_ts(
+    pool_address: str, token0_address: str, token1_address: str, lookback_days: int
+) -> pd.DataFrame:
+    return get_swap_volume_timeseries(
+        pool_address, token0_address, token1_address, lookback_days=lookback_days
+    )
+
+
+def build_row_from_pair(
+    pair: dict, pool_fees: Dict[str, Tuple[Optional[float], Optional[float]]]
+) -> dict:
     base_token = pair.get("baseToken", {})
     quote_token = pair.get("quoteToken", {})
     liquidity = pair.get("liquidity", {})
@@ -172,22 +394,31 @@ def build_dataframe_from_pair(pair: dict, fee_client: AerodromeFees) -> pd.DataF
     }
 
     if pair.get("chainId") == "base":
-        stable_fee = fee_client.get_pool_fee(row["pair_address"], True)
-        volatile_fee = fee_client.get_pool_fee(row["pair_address"], False)
+        stable_fee, volatile_fee = pool_fees.get(
+            (row["pair_address"] or "").lower(), (None, None)
+        )
         row["fee_stable_pct"] = stable_fee or 0.05
         row["fee_volatile_pct"] = volatile_fee or 0.30
 
-    return pd.DataFrame([row])
+    return row
 
 
-def create_price_chart(token_address: str, token_symbol: str) -> Optional[go.Figure]:
-    pair_data = fetch_token_price_history(token_address)
+def create_price_chart(
+    token_address: str, token_symbol: str, pair_data: Optional[dict]
+) -> Optional[go.Figure]:
     if not pair_data:
         return None
 
     current_price = float(pair_data.get("priceUsd", 0))
     change = float(pair_data.get("priceChange", {}).get("h24", 0))
+    return build_price_figure(token_address, token_symbol, current_price, change)
 
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_price_figure(
+    token_address: str, token_symbol: str, current_price: float, change: float
+) -> go.Figure:
+    # Cached so reordering reruns don't rebuild unchanged Plotly figures
     fig = go.Figure()
     fig.add_trace(
         go.Scatter(
@@ -207,6 +438,16 @@ def create_price_chart(token_address: str, token_symbol: str) -> Optional[go.Fig
     return fig
 
 
+def format_activity(label: str, event: dict) -> str:
+    # Age is taken at render time, so it stays current while the
+    # underlying activity is served from cache
+    hours_ago = (int(time.time()) - event["block_time"]) // 3600
+    return (
+        f"{label}: token0 {event['token0']} / token1 {event['token1']} "
+        f"by {event['who']} ({hours_ago}h ago)"
+    )
+
+
 # ---------- MAIN APP ----------
 
 
@@ -234,6 +475,7 @@ def main():
 
     if st.sidebar.button("🔄 Refresh Dex data (clear cache)"):
         st.cache_data.clear()
+        clear_pair_cache()
         st.rerun()
 
     # Process addresses
@@ -249,61 +491,45 @@ def main():
         st.info("👆 Enter at least one valid Aerodrome pool address (one per line).")
         st.stop()
 
-    fee_client = AerodromeFees(basescan_key)
+    fee_client = get_fee_client(basescan_key)
+    default_fees = get_default_fees_cached(BASE_RPC_URL)
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Default Stable Fee", f"{fee_client.get_default_fees()['stable']}%")
+        st.metric("Default Stable Fee", f"{default_fees['stable']}%")
     with col2:
-        st.metric("Default Volatile Fee", f"{fee_client.get_default_fees()['volatile']}%")
+        st.metric("Default Volatile Fee", f"{default_fees['volatile']}%")
     with col3:
         st.metric("RPC Status", "🟢 Connected (Dex & Base)")
 
+    # One batched RPC for all per-pool fees instead of two eth_calls per pool
+    pool_fees = fee_client.fetch_all_fees(pool_addresses)
+
     # Fetch DexScreener snapshots
-    all_rows: List[pd.DataFrame] = []
-    valid_pools = 0
+    rows: List[dict] = []
     with st.spinner("Fetching pool snapshots from DexScreener..."):
+        pairs = fetch_pairs_bulk("base", pool_addresses)
         for addr in pool_addresses:
-            pair = fetch_pair("base", addr.lower())
+            pair = pairs.get(addr.lower())
             if pair:
-                df_row = build_dataframe_from_pair(pair, fee_client)
-                all_rows.append(df_row)
-                valid_pools += 1
+                rows.append(build_row_from_pair(pair, pool_fees))
 
-    if not all_rows:
+    if not rows:
         st.error("❌ No valid pairs fetched from DexScreener.")
         st.stop()
 
-    df = pd.concat(all_rows, ignore_index=True)
-    st.success(f"✅ Loaded {valid_pools} pools")
+    df = pd.DataFrame.from_records(rows).astype(SNAPSHOT_DTYPES)
+    st.success(f"✅ Loaded {len(rows)} pools")
 
     # Overview table
     st.subheader("📊 Pools Overview")
-    display_cols = [
-        "pair_name",
-        "pair_address",
-        "token0_symbol",
-        "liquidity_token0",
-        "token1_symbol",
-        "liquidity_token1",
-        "liquidity_usd",
-        "volume_24h_usd",
-        "tx_24h_count",
-        "fee_stable_pct",
-    ]
-    df_display = df[display_cols].copy()
-    df_display.columns = [
-        "Pair",
-        "Address",
-        "Token A",
-        "Token A Balance",
-        "Token B",
-        "Token B Balance",
-        "Total Liq. (USD)",
-        "Vol. 24h (USD)",
-        "Trades 24h",
-        "Stable Fee %",
-    ]
-    st.dataframe(df_display, width='stretch', hide_index=True)
+    # column_order/column_config render straight from df, no display copy
+    st.dataframe(
+        df,
+        column_order=list(OVERVIEW_COLUMN_CONFIG),
+        column_config=OVERVIEW_COLUMN_CONFIG,
+        width='stretch',
+        hide_index=True,
+    )
 
     # Global aggregates
     col1, col2, col3 = st.columns(3)
@@ -341,7 +567,7 @@ def main():
 
     # Per-pool details with on-chain history
     st.subheader("🔍 Per-Pool Details (with On-Chain Activity)")
-    for _, row in df.iterrows():
+    for row in df.to_dict("records"):
         with st.expander(f"{row['pair_name']} | {row['pair_address'][:10]}..."):
             col1, col2, col3, col4 = st.columns(4)
             with col1:
@@ -373,17 +599,16 @@ def main():
             # Recent on-chain activity
             st.markdown("**Recent Pool Activity (on-chain)**")
             try:
-                activity = get_recent_activity(row["pair_address"], lookback_hours=48)
+                activity = _cached_recent_activity(row["pair_address"], 48)
                 has_any = False
-                if activity.latest_add:
-                    st.write(f"- {activity.latest_add}")
-                    has_any = True
-                if activity.latest_remove:
-                    st.write(f"- {activity.latest_remove}")
-                    has_any = True
-                if activity.latest_claim:
-                    st.write(f"- {activity.latest_claim}")
-                    has_any = True
+                for label, event in (
+                    ("Liquidity Added", activity.latest_add),
+                    ("Liquidity Removed", activity.latest_remove),
+                    ("Fees Claimed", activity.latest_claim),
+                ):
+                    if event:
+                        st.write(f"- {format_activity(label, event)}")
+                        has_any = True
                 if not has_any:
                     st.caption(
                         "No Mint/Burn/Claim events indexed for this pool in the last 48 hours."
@@ -394,7 +619,7 @@ def main():
             # Liquidity over time
             st.markdown("**Liquidity Over Time (events)**")
             try:
-                ts_df = get_liquidity_timeseries(row["pair_address"], lookback_days=lookback_days)
+                ts_df = _cached_liquidity_ts(row["pair_address"], lookback_days)
                 if not ts_df.empty:
                     fig_liq_ts = go.Figure()
                     fig_liq_ts.add_trace(
@@ -431,11 +656,11 @@ def main():
                 key=f"log_swap_{row['pair_address']}"
             )
             try:
-                vol_df = get_swap_volume_timeseries(
+                vol_df = _cached_swap_volume_ts(
                     row["pair_address"],
                     row["token0_address"],
                     row["token1_address"],
-                    lookback_days=lookback_days,
+                    lookback_days,
                 )
                 if not vol_df.empty:
                     fig_swap_ts = go.Figure()
@@ -470,12 +695,16 @@ def main():
 
 
     # Token price charts with drag/drop (unchanged pattern)
-    unique_tokens: Dict[str, str] = {}
-    for _, row in df.iterrows():
-        if row["token0_address"] not in unique_tokens:
-            unique_tokens[row["token0_address"]] = row["token0_symbol"]
-        if row["token1_address"] not in unique_tokens:
-            unique_tokens[row["token1_address"]] = row["token1_symbol"]
+    side0 = df[["token0_address", "token0_symbol"]].set_axis(["address", "symbol"], axis=1)
+    side1 = df[["token1_address", "token1_symbol"]].set_axis(["address", "symbol"], axis=1)
+    # Stable sort on the shared row index interleaves token0/token1 per pool,
+    # keeping first-seen order for the initial chart layout
+    tokens = (
+        pd.concat([side0, side1])
+        .sort_index(kind="stable")
+        .drop_duplicates("address")
+    )
+    unique_tokens: Dict[str, str] = dict(zip(tokens["address"], tokens["symbol"]))
 
     if not st.session_state.chart_order or set(st.session_state.chart_order) != set(
         unique_tokens.keys()
@@ -484,6 +713,14 @@ def main():
 
     st.subheader("📈 Token Price Charts (Reorder)")
 
+    # Prefetch all token prices in parallel before rendering
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_FETCH_WORKERS, len(unique_tokens))
+    ) as executor:
+        price_data = dict(
+            zip(unique_tokens, executor.map(fetch_token_price_history, unique_tokens))
+        )
+
     for i, token_addr in enumerate(st.session_state.chart_order):
         token_symbol = unique_tokens[token_addr]
         col1, col2, col3 = st.columns([0.1, 1, 0.1])
@@ -500,7 +737,7 @@ def main():
                 st.rerun()
 
         with col2:
-            fig = create_price_chart(token_addr, token_symbol)
+            fig = create_price_chart(token_addr, token_symbol, price_data[token_addr])
             if fig:
                 st.plotly_chart(fig, width='stretch', height=250)
             else:
@@ -13,10 +13,12 @@ Run periodically (cron/systemd) or in a screen/tmux session:
     BASE_RPC_URL=<your_rpc> python pool_events_indexer.py
 """
 
+import functools
 import os
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from web3 import Web3
 
@@ -27,6 +29,18 @@ w3 = Web3(Web3.HTTPProvider(BASE_RPC_URL))
 
 DB_PATH = os.environ.get("POOL_EVENTS_DB", "pool_events.db")
 
+# Max get_block calls per JSON-RPC batch (public endpoints cap batch size)
+BLOCK_BATCH_SIZE = 100
+
+# Concurrent per-pool eth_getLogs calls within one block range
+MAX_POOL_WORKERS = 8
+
+# Block ranges fetched concurrently by main()
+MAX_RANGE_WORKERS = 4
+
+# Bucket width of pool_liquidity_snapshots, in seconds
+SNAPSHOT_BUCKET_SECONDS = 3600
+
 # Pools to index (can be overridden by env var or file later)
 DEFAULT_POOLS: List[str] = [
     "0x9Da64ed1b87b3d0d3d1E731dd3aAAAc08eb0f5C3",
@@ -90,10 +104,130 @@ POOL_EVENTS_ABI = [
     },
 ]
 
+# topic0 -> event name, so one OR-filtered eth_getLogs can be dispatched client-side
+EVENT_TOPICS: Dict[bytes, str] = {
+    Web3.keccak(
+        text=f"{ev['name']}({','.join(i['type'] for i in ev['inputs'])})"
+    ): ev["name"]
+    for ev in POOL_EVENTS_ABI
+}
+EVENT_TOPIC_FILTER = [[Web3.to_hex(topic) for topic in EVENT_TOPICS]]
+
 # ---------- DB SETUP ----------
 
+INSERT_LIQUIDITY_SQL = """
+    INSERT OR IGNORE INTO pool_liquidity_events (
+        pool_address, event_type, token0_amount, token1_amount,
+        provider_address, tx_hash, log_index, block_number, block_time
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_SWAP_SQL = """
+    INSERT OR IGNORE INTO pool_swaps (
+        pool_address, sender, recipient,
+        amount0_in, amount1_in, amount0_out, amount1_out,
+        tx_hash, log_index, block_number, block_time
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_CLAIM_SQL = """
+    INSERT OR IGNORE INTO pool_fee_claims (
+        pool_address, sender, recipient, token0_fee, token1_fee,
+        tx_hash, log_index, block_number, block_time
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_LAST_SEEN_SQL = """
+    INSERT INTO pool_last_seen (pool_address, last_block_time) VALUES (?, ?)
+    ON CONFLICT(pool_address) DO UPDATE
+    SET last_block_time = MAX(last_block_time, excluded.last_block_time)
+"""
+
+
+def _create_unique_index(cur: sqlite3.Cursor, name: str, table: str, columns: str) -> None:
+    sql = f"CREATE UNIQUE INDEX IF NOT EXISTS {name} ON {table}({columns})"
+    try:
+        cur.execute(sql)
+    except sqlite3.IntegrityError:
+        # Older DBs may already hold duplicates; keep the first copy
+        cur.execute(
+            f"DELETE FROM {table} WHERE id NOT IN "
+            f"(SELECT MIN(id) FROM {table} GROUP BY {columns})"
+        )
+        cur.execute(sql)
+
+
+def _migrate_to_log_index(cur: sqlite3.Cursor, table: str, legacy_index: str) -> None:
+    """
+    Add log_index to a table created before events were keyed by log
+    position, replacing its content-based unique index.
+    """
+    columns = [row[1] for row in cur.execute(f"PRAGMA table_info({table})").fetchall()]
+    if "log_index" in columns:
+        return
+    cur.execute(f"ALTER TABLE {table} ADD COLUMN log_index INTEGER")
+    cur.execute(f"DROP INDEX IF EXISTS {legacy_index}")
+    # Legacy rows have no log position to tell events apart, so only exact
+    # copies (from re-indexing the checkpoint block) are collapsed
+    content = ", ".join(c for c in columns if c != "id")
+    cur.execute(
+        f"DELETE FROM {table} WHERE id NOT IN "
+        f"(SELECT MIN(id) FROM {table} GROUP BY {content})"
+    )
+
+
+def _rebuild_liquidity_snapshots(cur: sqlite3.Cursor, pool_address: str, from_ts: int) -> None:
+    """
+    Recompute a pool's hourly cumulative balances from the bucket holding
+    from_ts onwards, continuing from the last snapshot before it.
+    """
+    start_bucket = from_ts - from_ts % SNAPSHOT_BUCKET_SECONDS
+    cur.execute(
+        """
+        SELECT token0_balance, token1_balance FROM pool_liquidity_snapshots
+        WHERE pool_address = ? AND bucket_ts < ?
+        ORDER BY bucket_ts DESC LIMIT 1
+        """,
+        (pool_address, start_bucket),
+    )
+    prev = cur.fetchone()
+    # Balances are uint256-scale and may go negative (history starts
+    # mid-life), so they are kept exact as Python ints and stored as text
+    t0, t1 = (int(prev[0]), int(prev[1])) if prev else (0, 0)
+
+    cur.execute(
+        """
+        SELECT event_type, token0_amount, token1_amount, block_time
+        FROM pool_liquidity_events
+        WHERE pool_address = ? AND block_time >= ?
+        ORDER BY block_time ASC
+        """,
+        (pool_address, start_bucket),
+    )
+    buckets: Dict[int, Tuple[str, str]] = {}
+    for event_type, amount0, amount1, block_time in cur.fetchall():
+        sign = 1 if event_type == "ADD" else -1
+        t0 += sign * int(amount0)
+        t1 += sign * int(amount1)
+        buckets[block_time - block_time % SNAPSHOT_BUCKET_SECONDS] = (str(t0), str(t1))
+
+    cur.executemany(
+        """
+        INSERT OR REPLACE INTO pool_liquidity_snapshots
+            (pool_address, bucket_ts, token0_balance, token1_balance)
+        VALUES (?, ?, ?, ?)
+        """,
+        [(pool_address, bucket, b0, b1) for bucket, (b0, b1) in buckets.items()],
+    )
+
 
 def init_db(conn: sqlite3.Connection) -> None:
+    # WAL lets the Streamlit reader keep reading while we write
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+
     cur = conn.cursor()
     cur.execute(
         """
@@ -105,6 +239,7 @@ def init_db(conn: sqlite3.Connection) -> None:
             token1_amount TEXT NOT NULL,
             provider_address TEXT NOT NULL,
             tx_hash TEXT NOT NULL,
+            log_index INTEGER,               -- NULL on rows indexed before it was stored
             block_number INTEGER NOT NULL,
             block_time INTEGER NOT NULL
         )
@@ -122,6 +257,7 @@ def init_db(conn: sqlite3.Connection) -> None:
             amount0_out TEXT NOT NULL,
             amount1_out TEXT NOT NULL,
             tx_hash TEXT NOT NULL,
+            log_index INTEGER,
             block_number INTEGER NOT NULL,
             block_time INTEGER NOT NULL
         )
@@ -137,6 +273,7 @@ def init_db(conn: sqlite3.Connection) -> None:
             token0_fee TEXT NOT NULL,
             token1_fee TEXT NOT NULL,
             tx_hash TEXT NOT NULL,
+            log_index INTEGER,
             block_number INTEGER NOT NULL,
             block_time INTEGER NOT NULL
         )
@@ -150,6 +287,85 @@ def init_db(conn: sqlite3.Connection) -> None:
         )
         """
     )
+
+    # Latest liquidity/claim event per pool, so the reader can skip quiet
+    # pools without probing each event table
+    has_last_seen = cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pool_last_seen'"
+    ).fetchone()
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pool_last_seen (
+            pool_address TEXT PRIMARY KEY,
+            last_block_time INTEGER NOT NULL
+        )
+        """
+    )
+
+    # Running token0/token1 balance at the end of each hour with liquidity
+    # events, so long reader lookbacks don't replay every Mint/Burn
+    has_snapshots = cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pool_liquidity_snapshots'"
+    ).fetchone()
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pool_liquidity_snapshots (
+            pool_address TEXT NOT NULL,
+            bucket_ts INTEGER NOT NULL,      -- start of the hour
+            token0_balance TEXT NOT NULL,    -- signed, cumulative since first event
+            token1_balance TEXT NOT NULL,
+            PRIMARY KEY (pool_address, bucket_ts)
+        )
+        """
+    )
+
+    # Per-pool time-window lookups used by the Streamlit reader
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_liq_pool_time "
+        "ON pool_liquidity_events(pool_address, block_time DESC)"
+    )
+    # Latest-ADD/REMOVE lookups in get_recent_activity
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ple_pool_type_time "
+        "ON pool_liquidity_events(pool_address, event_type, block_time DESC)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_swaps_pool_time "
+        "ON pool_swaps(pool_address, block_time DESC)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_claims_pool_time "
+        "ON pool_fee_claims(pool_address, block_time DESC)"
+    )
+
+    # (tx_hash, log_index) identifies a log, so re-indexing an overlapping
+    # range is a no-op while distinct events in one tx are all kept
+    _migrate_to_log_index(cur, "pool_liquidity_events", "idx_liq_tx")
+    _create_unique_index(cur, "idx_liq_log", "pool_liquidity_events", "tx_hash, log_index")
+    _migrate_to_log_index(cur, "pool_swaps", "idx_swaps_tx")
+    _create_unique_index(cur, "idx_swaps_log", "pool_swaps", "tx_hash, log_index")
+    _migrate_to_log_index(cur, "pool_fee_claims", "idx_claims_tx")
+    _create_unique_index(cur, "idx_claims_log", "pool_fee_claims", "tx_hash, log_index")
+
+    # Seed the derived tables from events indexed before they existed. This
+    # runs after the unique-index migration so duplicates it removes are
+    # never counted.
+    if not has_last_seen:
+        cur.execute(
+            """
+            INSERT INTO pool_last_seen (pool_address, last_block_time)
+            SELECT pool_address, MAX(block_time) FROM (
+                SELECT pool_address, block_time FROM pool_liquidity_events
+                UNION ALL
+                SELECT pool_address, block_time FROM pool_fee_claims
+            )
+            GROUP BY pool_address
+            """
+        )
+    if not has_snapshots:
+        cur.execute("SELECT DISTINCT pool_address FROM pool_liquidity_events")
+        for (pool_address,) in cur.fetchall():
+            _rebuild_liquidity_snapshots(cur, pool_address, 0)
     conn.commit()
 
 
@@ -178,87 +394,116 @@ def update_last_block(conn: sqlite3.Connection, last_block: int) -> None:
     conn.commit()
 
 
+_block_ts_cache: Dict[int, int] = {}
+
+
 def get_block_timestamp(block_number: int) -> int:
-    block = w3.eth.get_block(block_number)
-    return int(block.timestamp)
+    if block_number not in _block_ts_cache:
+        block = w3.eth.get_block(block_number)
+        _block_ts_cache[block_number] = int(block.timestamp)
+    return _block_ts_cache[block_number]
+
+
+def get_block_timestamps(block_numbers: Iterable[int]) -> Dict[int, int]:
+    """
+    Resolve timestamps for many blocks using JSON-RPC batch requests.
+    Results are memoized, so pools scanned over the same range share lookups.
+
+    The batch goes straight to the provider rather than through
+    w3.batch_requests(), so it is safe to call while other threads have
+    requests in flight.
+    """
+    wanted = set(block_numbers)
+    missing = sorted(b for b in wanted if b not in _block_ts_cache)
+    for i in range(0, len(missing), BLOCK_BATCH_SIZE):
+        chunk = missing[i : i + BLOCK_BATCH_SIZE]
+        try:
+            responses = w3.provider.make_batch_request(
+                [("eth_getBlockByNumber", [hex(b), False]) for b in chunk]
+            )
+            if not isinstance(responses, list):
+                raise ValueError(f"batch request failed: {responses}")
+            for b, resp in zip(chunk, responses):
+                _block_ts_cache[b] = int(resp["result"]["timestamp"], 16)
+        except Exception:
+            # Endpoint may not support batching; fall back to single calls
+            for b in chunk:
+                get_block_timestamp(b)
+    return {b: _block_ts_cache[b] for b in wanted}
 
 
 # ---------- INDEXING ----------
 
+EventRows = Tuple[List[tuple], List[tuple], List[tuple]]
 
-def index_pool_events(
-    conn: sqlite3.Connection,
-    pool_address: str,
-    from_block: int,
-    to_block: int,
-) -> None:
-    pool = w3.eth.contract(address=Web3.to_checksum_address(pool_address), abi=POOL_EVENTS_ABI)
-    cur = conn.cursor()
 
-    # Mint -> ADD liquidity
-    mint_events = pool.events.Mint.get_logs(from_block=from_block, to_block=to_block)
-    for ev in mint_events:
-        block_number = ev["blockNumber"]
-        ts = get_block_timestamp(block_number)
-        args = ev["args"]
-        cur.execute(
-            """
-            INSERT INTO pool_liquidity_events (
-                pool_address, event_type, token0_amount, token1_amount,
-                provider_address, tx_hash, block_number, block_time
-            ) VALUES (?, 'ADD', ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                pool_address.lower(),
-                str(args["amount0"]),
-                str(args["amount1"]),
-                args["sender"],
-                ev["transactionHash"].hex(),
-                block_number,
-                ts,
-            ),
-        )
+@functools.lru_cache(maxsize=None)
+def _pool_contract(addr_lower: str):
+    # ABI parsing is reused across every block range of the same pool
+    return w3.eth.contract(address=Web3.to_checksum_address(addr_lower), abi=POOL_EVENTS_ABI)
 
-    # Burn -> REMOVE liquidity
-    burn_events = pool.events.Burn.get_logs(from_block=from_block, to_block=to_block)
-    for ev in burn_events:
-        block_number = ev["blockNumber"]
-        ts = get_block_timestamp(block_number)
-        args = ev["args"]
-        cur.execute(
-            """
-            INSERT INTO pool_liquidity_events (
-                pool_address, event_type, token0_amount, token1_amount,
-                provider_address, tx_hash, block_number, block_time
-            ) VALUES (?, 'REMOVE', ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                pool_address.lower(),
-                str(args["amount0"]),
-                str(args["amount1"]),
-                args["sender"],
-                ev["transactionHash"].hex(),
-                block_number,
-                ts,
-            ),
-        )
+
+def fetch_pool_events(pool_address: str, from_block: int, to_block: int) -> Dict[str, list]:
+    """
+    Fetch Mint/Burn/Swap/Claim logs for one pool with a single eth_getLogs
+    (topic0 OR-filter) and decode them by event name.
+    """
+    pool = _pool_contract(pool_address.lower())
+    logs = w3.eth.get_logs(
+        {
+            "address": pool.address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": EVENT_TOPIC_FILTER,
+        }
+    )
+    events: Dict[str, list] = {name: [] for name in EVENT_TOPICS.values()}
+    for log in logs:
+        name = EVENT_TOPICS.get(bytes(log["topics"][0]))
+        if name is not None:
+            events[name].append(pool.events[name]().process_log(log))
+    return events
+
+
+def event_block_numbers(events: Dict[str, list]) -> Set[int]:
+    return {ev["blockNumber"] for evs in events.values() for ev in evs}
+
+
+def build_event_rows(
+    pool_address: str, events: Dict[str, list], ts_by_block: Dict[int, int]
+) -> EventRows:
+    """
+    Turn decoded events into (liquidity, swap, claim) rows for the INSERT_* statements.
+    """
+    pool_lower = pool_address.lower()
+    liquidity_rows = []
+    swap_rows = []
+    claim_rows = []
+
+    # Mint -> ADD liquidity, Burn -> REMOVE liquidity
+    for event_type, liq_events in (("ADD", events["Mint"]), ("REMOVE", events["Burn"])):
+        for ev in liq_events:
+            args = ev["args"]
+            liquidity_rows.append(
+                (
+                    pool_lower,
+                    event_type,
+                    str(args["amount0"]),
+                    str(args["amount1"]),
+                    args["sender"],
+                    ev["transactionHash"].hex(),
+                    ev["logIndex"],
+                    ev["blockNumber"],
+                    ts_by_block[ev["blockNumber"]],
+                )
+            )
 
     # Swap -> volume/trades
-    swap_events = pool.events.Swap.get_logs(from_block=from_block, to_block=to_block)
-    for ev in swap_events:
-        block_number = ev["blockNumber"]
-        ts = get_block_timestamp(block_number)
+    for ev in events["Swap"]:
         args = ev["args"]
-        cur.execute(
-            """
-            INSERT INTO pool_swaps (
-                pool_address, sender, recipient,
-                amount0_in, amount1_in, amount0_out, amount1_out,
-                tx_hash, block_number, block_time
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        swap_rows.append(
             (
-                pool_address.lower(),
+                pool_lower,
                 args["sender"],
                 args["recipient"],
                 str(args["amount0In"]),
@@ -266,37 +511,90 @@ def index_pool_events(
                 str(args["amount0Out"]),
                 str(args["amount1Out"]),
                 ev["transactionHash"].hex(),
-                block_number,
-                ts,
-            ),
+                ev["logIndex"],
+                ev["blockNumber"],
+                ts_by_block[ev["blockNumber"]],
+            )
         )
 
     # Claim -> fee claims
-    claim_events = pool.events.Claim.get_logs(from_block=from_block, to_block=to_block)
-    for ev in claim_events:
-        block_number = ev["blockNumber"]
-        ts = get_block_timestamp(block_number)
+    for ev in events["Claim"]:
         args = ev["args"]
-        cur.execute(
-            """
-            INSERT INTO pool_fee_claims (
-                pool_address, sender, recipient, token0_fee, token1_fee,
-                tx_hash, block_number, block_time
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        claim_rows.append(
             (
-                pool_address.lower(),
+                pool_lower,
                 args["sender"],
                 args["recipient"],
                 str(args["amount0"]),
                 str(args["amount1"]),
                 ev["transactionHash"].hex(),
-                block_number,
-                ts,
-            ),
+                ev["logIndex"],
+                ev["blockNumber"],
+                ts_by_block[ev["blockNumber"]],
+            )
         )
 
-    conn.commit()
+    return liquidity_rows, swap_rows, claim_rows
+
+
+def write_event_rows(conn: sqlite3.Connection, rows: List[EventRows]) -> None:
+    # One transaction, one prepared statement per table
+    last_seen: Dict[str, int] = {}
+    snapshot_from: Dict[str, int] = {}
+    with conn:
+        for liquidity_rows, swap_rows, claim_rows in rows:
+            conn.executemany(INSERT_LIQUIDITY_SQL, liquidity_rows)
+            conn.executemany(INSERT_SWAP_SQL, swap_rows)
+            conn.executemany(INSERT_CLAIM_SQL, claim_rows)
+            # pool_address leads and block_time ends both row layouts
+            for row in (*liquidity_rows, *claim_rows):
+                last_seen[row[0]] = max(last_seen.get(row[0], 0), row[-1])
+            for row in liquidity_rows:
+                snapshot_from[row[0]] = min(snapshot_from.get(row[0], row[-1]), row[-1])
+        conn.executemany(UPSERT_LAST_SEEN_SQL, last_seen.items())
+        # Replaying from the table rather than the batch keeps snapshots
+        # right when INSERT OR IGNORE drops already-indexed events
+        cur = conn.cursor()
+        for pool_address, from_ts in snapshot_from.items():
+            _rebuild_liquidity_snapshots(cur, pool_address, from_ts)
+
+
+def index_pool_events(
+    conn: sqlite3.Connection,
+    pool_address: str,
+    from_block: int,
+    to_block: int,
+) -> None:
+    events = fetch_pool_events(pool_address, from_block, to_block)
+    ts_by_block = get_block_timestamps(event_block_numbers(events))
+    write_event_rows(conn, [build_event_rows(pool_address, events, ts_by_block)])
+
+
+def fetch_range(pools: List[str], from_block: int, to_block: int) -> List[EventRows]:
+    """
+    Fetch and decode all pools' events over one block range without touching
+    the DB; per-pool eth_getLogs calls run concurrently.
+
+    Raises if any pool's fetch fails, so the caller never checkpoints past a
+    range with a pool missing from it.
+    """
+
+    def fetch(pool: str) -> Dict[str, list]:
+        try:
+            return fetch_pool_events(pool, from_block, to_block)
+        except Exception as e:
+            raise RuntimeError(f"pool {pool}: {e}") from e
+
+    with ThreadPoolExecutor(max_workers=min(MAX_POOL_WORKERS, len(pools))) as executor:
+        fetched = list(zip(pools, executor.map(fetch, pools)))
+
+    # One timestamp batch for every pool in the range
+    block_numbers: Set[int] = set()
+    for _, events in fetched:
+        block_numbers |= event_block_numbers(events)
+    ts_by_block = get_block_timestamps(block_numbers)
+
+    return [build_event_rows(pool, events, ts_by_block) for pool, events in fetched]
 
 
 def main(pools: Optional[List[str]] = None) -> None:
@@ -307,22 +605,49 @@ def main(pools: Optional[List[str]] = None) -> None:
     init_db(conn)
 
     current_block = w3.eth.block_number
-    from_block = get_start_block(conn)
-    if from_block >= current_block:
+    # last_block was fully written, so resume after it rather than re-reading it
+    from_block = get_start_block(conn) + 1
+    if from_block > current_block:
         print("No new blocks to index.")
         conn.close()
         return
 
     step = 5_000
-    for start in range(from_block, current_block + 1, step):
-        end = min(start + step - 1, current_block)
-        print(f"Indexing blocks {start} -> {end}")
-        for pool in pools:
+    ranges = [
+        (start, min(start + step - 1, current_block))
+        for start in range(from_block, current_block + 1, step)
+    ]
+
+    # Ranges are fetched concurrently but written strictly in order, and
+    # last_block only advances past a contiguous prefix of written ranges,
+    # so a failed or interrupted run never leaves a gap behind the checkpoint.
+    with ThreadPoolExecutor(max_workers=MAX_RANGE_WORKERS) as executor:
+        futures = {
+            executor.submit(fetch_range, pools, start, end): i
+            for i, (start, end) in enumerate(ranges)
+        }
+        completed: Dict[int, List[EventRows]] = {}
+        next_range = 0
+        stop_at = len(ranges)
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            i = futures[future]
             try:
-                index_pool_events(conn, pool, start, end)
+                completed[i] = future.result()
             except Exception as e:
-                print(f"Error indexing pool {pool} in range {start}-{end}: {e}")
-        update_last_block(conn, end)
+                start, end = ranges[i]
+                print(f"Error fetching blocks {start}-{end}, stopping before this range: {e}")
+                stop_at = min(stop_at, i)
+                for other, j in futures.items():
+                    if j > stop_at:
+                        other.cancel()
+            while next_range < stop_at and next_range in completed:
+                start, end = ranges[next_range]
+                print(f"Indexing blocks {start} -> {end}")
+                write_event_rows(conn, completed.pop(next_range))
+                update_last_block(conn, end)
+                next_range += 1
 
     conn.close()
 
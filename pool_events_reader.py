@@ -1,19 +1,33 @@
 """
 pool_events_reader.py
 
-Read-only helpers on top of pool_events.db for Streamlit.
+Query helpers on top of pool_events.db for Streamlit.
+
+Mostly reads, but the reader also writes to the database: it caches token
+decimals in a token_decimals table and creates the indexes its queries
+rely on (then runs ANALYZE). A read-only database file still works; those
+writes are skipped.
 """
 
+import functools
+import logging
 import os
+import queue
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, Iterator, List, Dict
 
+import numpy as np
 import pandas as pd
 
 from web3 import Web3  # new import
 
+logger = logging.getLogger(__name__)
+
 BASE_RPC_URL = os.environ.get("BASE_RPC_URL", "https://mainnet.base.org")
 w3 = Web3(Web3.HTTPProvider(BASE_RPC_URL))
 
@@ -29,155 +43,436 @@ ERC20_ABI = [
     }
 ]
 
-_decimals_cache: Dict[str, int] = {}
+# decimals() function selector
+DECIMALS_SELECTOR = Web3.keccak(text="decimals()")[:4].to_0x_hex()
+
+_decimals_cache: Dict[str, int] = {}  # lowercase address -> decimals
 
 
 DB_PATH = os.environ.get("POOL_EVENTS_DB", "pool_events.db")
 
+# Idle SQLite connections kept open for reuse across Streamlit reruns
+MAX_POOLED_CONNECTIONS = 8
+
+# Rows pulled per fetch when rebuilding liquidity balances
+LIQUIDITY_CHUNK_ROWS = 10_000
+
+# Longer lookbacks read the indexer's hourly pool_liquidity_snapshots
+# instead of replaying every Mint/Burn
+SNAPSHOT_MIN_LOOKBACK_DAYS = 3
+SNAPSHOT_BUCKET_SECONDS = 3600
+
+# Declared up front so frames are built without per-column dtype inference
+LIQUIDITY_TS_DTYPES = {
+    "time": "datetime64[s]",
+    "token0_balance": "float64",
+    "token1_balance": "float64",
+}
+SWAP_TS_DTYPES = {
+    "time": "datetime64[s]",
+    "token0_volume": "float64",
+    "token1_volume": "float64",
+}
+
+
+# Also used by the Streamlit app: this module is imported once per process,
+# so the memo survives reruns that re-execute the app script
+@functools.lru_cache(maxsize=4096)
+def _checksum(addr: str) -> str:
+    return Web3.to_checksum_address(addr)
+
+
+def _fetch_decimals_rpc(addrs: List[str]) -> Dict[str, Optional[int]]:
+    """
+    Call decimals() on every token in one JSON-RPC batch; None marks a failure.
+    """
+    try:
+        responses = w3.provider.make_batch_request(
+            [("eth_call", [{"to": addr, "data": DECIMALS_SELECTOR}, "latest"]) for addr in addrs]
+        )
+        if not isinstance(responses, list):
+            raise ValueError(f"batch request failed: {responses}")
+        out: Dict[str, Optional[int]] = {}
+        for addr, resp in zip(addrs, responses):
+            result = resp.get("result")
+            out[addr] = int(result, 16) if result and result != "0x" else None
+        return out
+    except Exception:
+        # Endpoint may not support batching; fall back to single calls
+        out = {}
+        for addr in addrs:
+            try:
+                contract = w3.eth.contract(address=_checksum(addr), abi=ERC20_ABI)
+                out[addr] = int(contract.functions.decimals().call())
+            except Exception:
+                out[addr] = None
+        return out
+
+
+def get_tokens_decimals(token_addresses: List[str]) -> List[int]:
+    """
+    Fetch decimals for several tokens at once and cache them.
+    Lookup order: in-process cache, token_decimals table, one batched RPC.
+    Falls back to 18 for tokens whose call fails.
+    """
+    # Keyed by lowercase address, so cache hits skip checksumming entirely
+    keys = [a.lower() for a in token_addresses]
+    missing = [k for k in dict.fromkeys(keys) if k not in _decimals_cache]
+
+    if missing:
+        # ERC-20 decimals are immutable, so values persisted by an earlier
+        # process are always valid
+        try:
+            with get_conn() as conn:
+                rows = conn.execute(
+                    "SELECT address, decimals FROM token_decimals "
+                    f"WHERE address IN ({','.join('?' * len(missing))})",
+                    missing,
+                ).fetchall()
+            _decimals_cache.update(rows)
+        except sqlite3.OperationalError:
+            # No token_decimals table (read-only database); go to RPC
+            pass
+        missing = [k for k in missing if k not in _decimals_cache]
+
+    if missing:
+        fetched = _fetch_decimals_rpc(missing)
+        new_rows = []
+        for key in missing:
+            decimals = fetched.get(key)
+            if decimals is None:
+                # Not persisted: a transient RPC failure shouldn't pin the fallback
+                _decimals_cache[key] = 18
+            else:
+                _decimals_cache[key] = decimals
+                new_rows.append((key, decimals))
+        if new_rows:
+            try:
+                with get_conn() as conn, conn:
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO token_decimals (address, decimals) VALUES (?, ?)",
+                        new_rows,
+                    )
+            except sqlite3.OperationalError:
+                # Read-only database: the in-process cache still has them
+                pass
+
+    return [_decimals_cache[k] for k in keys]
+
+
 def get_token_decimals(token_address: str) -> int:
     """
     Fetch token decimals once and cache them.
     Falls back to 18 if the call fails.
     """
-    addr = w3.to_checksum_address(token_address)
-    if addr in _decimals_cache:
-        return _decimals_cache[addr]
-    try:
-        contract = w3.eth.contract(address=addr, abi=ERC20_ABI)
-        decimals = contract.functions.decimals().call()
-        _decimals_cache[addr] = int(decimals)
-        return int(decimals)
-    except Exception:
-        _decimals_cache[addr] = 18
-        return 18
+    return get_tokens_decimals([token_address])[0]
 
 
+# Same definitions as the indexer's init_db, so whichever side opens the
+# database first creates them and the other's IF NOT EXISTS is a no-op
+READER_INDEXES = {
+    "idx_ple_pool_type_time": (
+        "pool_liquidity_events",
+        "pool_address, event_type, block_time DESC",
+    ),
+    "idx_swaps_pool_time": ("pool_swaps", "pool_address, block_time DESC"),
+    "idx_claims_pool_time": ("pool_fee_claims", "pool_address, block_time DESC"),
+}
+
+
+def _ensure_indexes(conn: sqlite3.Connection) -> None:
+    """
+    Make sure the composite indexes behind the reader's queries exist,
+    then refresh planner statistics if anything changed.
+    """
+    existing = {
+        row[0]: row[1]
+        for row in conn.execute("SELECT name, type FROM sqlite_master")
+    }
+    created = False
+    for name, (table, columns) in READER_INDEXES.items():
+        # The indexer creates the tables; skip any it hasn't written yet
+        if existing.get(table) != "table" or name in existing:
+            continue
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+        created = True
+    if created or "sqlite_stat1" not in existing:
+        conn.execute("ANALYZE")
+    conn.commit()
+
+
+# Idle connections kept for reuse; LIFO hands back the most recently used,
+# whose page cache is warmest
+_conn_pool: queue.LifoQueue = queue.LifoQueue(maxsize=MAX_POOLED_CONNECTIONS)
+# Connection checked out by the current call chain, so nested get_conn()
+# calls reuse it instead of taking a second one from the pool
+_conn_var: ContextVar[Optional[sqlite3.Connection]] = ContextVar("conn", default=None)
+_schema_lock = threading.Lock()
+_schema_ready = False
+
+
+def _open_conn() -> sqlite3.Connection:
+    global _schema_ready
+    # Pooled connections move between Streamlit session threads, but each is
+    # only ever used by one of them at a time
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-64000")
+    with _schema_lock:
+        if not _schema_ready:
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS token_decimals (
+                        address TEXT PRIMARY KEY,    -- lowercase
+                        decimals INTEGER NOT NULL
+                    )
+                    """
+                )
+                conn.commit()
+                _ensure_indexes(conn)
+            except sqlite3.OperationalError as e:
+                # Read-only database: serve queries without the reader's own
+                # table and indexes rather than failing every call
+                conn.rollback()
+                logger.warning("Skipping schema setup on %s: %s", DB_PATH, e)
+            _schema_ready = True
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+@contextmanager
+def get_conn() -> Iterator[sqlite3.Connection]:
+    """
+    Check out a pooled connection for the duration of the block.
+    WAL lets concurrent Streamlit sessions read on separate connections
+    instead of serializing on one shared handle.
+    """
+    conn = _conn_var.get()
+    if conn is not None:
+        yield conn
+        return
 
-def _conn() -> sqlite3.Connection:
-    return sqlite3.connect(DB_PATH)
+    try:
+        conn = _conn_pool.get_nowait()
+    except queue.Empty:
+        conn = _open_conn()
+    token = _conn_var.set(conn)
+    try:
+        yield conn
+    finally:
+        _conn_var.reset(token)
+        try:
+            _conn_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
 
 
 @dataclass
 class RecentActivity:
+    """
+    Latest events per kind as dicts with token0, token1 (raw uint256
+    strings), who and block_time; None when absent. Display is the view's job.
+    """
+
     pool_address: str
-    latest_add: Optional[str]
-    latest_remove: Optional[str]
-    latest_claim: Optional[str]
+    latest_add: Optional[dict]
+    latest_remove: Optional[dict]
+    latest_claim: Optional[dict]
 
 
 def get_recent_activity(pool_address: str, lookback_hours: int = 48) -> RecentActivity:
-    conn = _conn()
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-
-    since_ts = int((datetime.utcnow() - timedelta(hours=lookback_hours)).timestamp())
+    since_ts = int(time.time()) - lookback_hours * 3600
     pool_lower = pool_address.lower()
 
-    # Latest ADD
-    cur.execute(
-        """
-        SELECT token0_amount, token1_amount, provider_address, block_time
-        FROM pool_liquidity_events
-        WHERE pool_address = ? AND event_type = 'ADD' AND block_time >= ?
-        ORDER BY block_time DESC LIMIT 1
-        """,
-        (pool_lower, since_ts),
-    )
-    add_row = cur.fetchone()
-
-    # Latest REMOVE
-    cur.execute(
-        """
-        SELECT token0_amount, token1_amount, provider_address, block_time
-        FROM pool_liquidity_events
-        WHERE pool_address = ? AND event_type = 'REMOVE' AND block_time >= ?
-        ORDER BY block_time DESC LIMIT 1
-        """,
-        (pool_lower, since_ts),
-    )
-    remove_row = cur.fetchone()
-
-    # Latest Claim
-    cur.execute(
-        """
-        SELECT token0_fee, token1_fee, sender, block_time
-        FROM pool_fee_claims
-        WHERE pool_address = ? AND block_time >= ?
-        ORDER BY block_time DESC LIMIT 1
-        """,
-        (pool_lower, since_ts),
-    )
-    claim_row = cur.fetchone()
+    with get_conn() as conn:
+        cur = conn.cursor()
+
+        # Quiet pools (nothing since the cutoff, or never) skip the event
+        # probes entirely. Databases from before the indexer kept
+        # pool_last_seen fall through to the full queries.
+        quiet = False
+        try:
+            cur.execute(
+                "SELECT last_block_time FROM pool_last_seen WHERE pool_address = ?",
+                (pool_lower,),
+            )
+            last_seen = cur.fetchone()
+            quiet = last_seen is None or last_seen[0] < since_ts
+        except sqlite3.OperationalError:
+            pass
+        if quiet:
+            return RecentActivity(
+                pool_address=pool_address,
+                latest_add=None,
+                latest_remove=None,
+                latest_claim=None,
+            )
+
+        # Latest ADD, REMOVE and fee claim in one round trip; each branch is
+        # an index seek on (pool_address[, event_type], block_time). Claims
+        # are aliased onto the liquidity column names.
+        cur.execute(
+            """
+            SELECT * FROM (
+                SELECT event_type, token0_amount, token1_amount, provider_address, block_time
+                FROM pool_liquidity_events
+                WHERE pool_address = ? AND event_type = 'ADD' AND block_time >= ?
+                ORDER BY block_time DESC LIMIT 1
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT event_type, token0_amount, token1_amount, provider_address, block_time
+                FROM pool_liquidity_events
+                WHERE pool_address = ? AND event_type = 'REMOVE' AND block_time >= ?
+                ORDER BY block_time DESC LIMIT 1
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'CLAIM', token0_fee, token1_fee, sender, block_time
+                FROM pool_fee_claims
+                WHERE pool_address = ? AND block_time >= ?
+                ORDER BY block_time DESC LIMIT 1
+            )
+            """,
+            (pool_lower, since_ts) * 3,
+        )
+        latest = {
+            event_type: {"token0": t0, "token1": t1, "who": who, "block_time": block_time}
+            for event_type, t0, t1, who, block_time in cur.fetchall()
+        }
 
-    def fmt(row, label: str, token0_key: str, token1_key: str, who_key: str) -> Optional[str]:
-        if not row:
-            return None
-        t0 = row[token0_key]
-        t1 = row[token1_key]
-        who = row[who_key]
-        age = datetime.utcnow() - datetime.utcfromtimestamp(row["block_time"])
-        hours_ago = int(age.total_seconds() // 3600)
-        return f"{label}: token0 {t0} / token1 {t1} by {who} ({hours_ago}h ago)"
-
-    activity = RecentActivity(
+    return RecentActivity(
         pool_address=pool_address,
-        latest_add=fmt(add_row, "Liquidity Added", "token0_amount", "token1_amount", "provider_address"),
-        latest_remove=fmt(
-            remove_row, "Liquidity Removed", "token0_amount", "token1_amount", "provider_address"
-        ),
-        latest_claim=fmt(claim_row, "Fees Claimed", "token0_fee", "token1_fee", "sender"),
+        latest_add=latest.get("ADD"),
+        latest_remove=latest.get("REMOVE"),
+        latest_claim=latest.get("CLAIM"),
     )
 
-    conn.close()
-    return activity
+
+def _empty_frame(dtypes: Dict[str, str]) -> pd.DataFrame:
+    return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in dtypes.items()})
+
+
+def _liquidity_from_snapshots(pool_lower: str, since_ts: int) -> Optional[pd.DataFrame]:
+    """
+    Hourly balances relative to since_ts, from pool_liquidity_snapshots.
+    Returns None when the database has no snapshot table yet.
+    """
+    start_bucket = since_ts - since_ts % SNAPSHOT_BUCKET_SECONDS
+
+    with get_conn() as conn:
+        try:
+            prev = conn.execute(
+                """
+                SELECT token0_balance, token1_balance FROM pool_liquidity_snapshots
+                WHERE pool_address = ? AND bucket_ts < ?
+                ORDER BY bucket_ts DESC LIMIT 1
+                """,
+                (pool_lower, start_bucket),
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        # Events of the first hour that fall before the cutoff still count
+        # towards the baseline
+        head = conn.execute(
+            """
+            SELECT event_type, token0_amount, token1_amount
+            FROM pool_liquidity_events
+            WHERE pool_address = ? AND block_time >= ? AND block_time < ?
+            """,
+            (pool_lower, start_bucket, since_ts),
+        ).fetchall()
+        snapshots = conn.execute(
+            """
+            SELECT bucket_ts, token0_balance, token1_balance
+            FROM pool_liquidity_snapshots
+            WHERE pool_address = ? AND bucket_ts >= ?
+            ORDER BY bucket_ts ASC
+            """,
+            (pool_lower, start_bucket),
+        ).fetchall()
+
+    if not snapshots:
+        return _empty_frame(LIQUIDITY_TS_DTYPES)
+
+    base0, base1 = (int(prev[0]), int(prev[1])) if prev else (0, 0)
+    for event_type, amount0, amount1 in head:
+        sign = 1 if event_type == "ADD" else -1
+        base0 += sign * int(amount0)
+        base1 += sign * int(amount1)
+
+    # Subtract the baseline exactly before dropping to float64
+    buckets, bal0, bal1 = zip(*snapshots)
+    return pd.DataFrame(
+        {
+            "time": np.array(buckets, dtype="datetime64[s]"),
+            "token0_balance": np.array([int(b) - base0 for b in bal0], dtype="float64"),
+            "token1_balance": np.array([int(b) - base1 for b in bal1], dtype="float64"),
+        }
+    )
 
 
 def get_liquidity_timeseries(pool_address: str, lookback_days: int = 7) -> pd.DataFrame:
     """
     Reconstruct cumulative balances for token0/token1 from Mint/Burn.
+    Lookbacks over SNAPSHOT_MIN_LOOKBACK_DAYS come back at hourly resolution.
     """
-    conn = _conn()
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-
-    since_ts = int((datetime.utcnow() - timedelta(days=lookback_days)).timestamp())
+    since_ts = int(time.time()) - lookback_days * 86400
     pool_lower = pool_address.lower()
 
-    cur.execute(
-        """
-        SELECT event_type, token0_amount, token1_amount, block_time
-        FROM pool_liquidity_events
-        WHERE pool_address = ? AND block_time >= ?
-        ORDER BY block_time ASC
-        """,
-        (pool_lower, since_ts),
-    )
-    rows = cur.fetchall()
-    conn.close()
-
-    if not rows:
-        return pd.DataFrame(columns=["time", "token0_balance", "token1_balance"])
-
-    t0 = 0
-    t1 = 0
-    out: List[Dict] = []
-    for r in rows:
-        amt0 = int(r["token0_amount"])
-        amt1 = int(r["token1_amount"])
-        if r["event_type"] == "ADD":
-            t0 += amt0
-            t1 += amt1
-        else:
-            t0 -= amt0
-            t1 -= amt1
-        out.append(
-            {
-                "time": datetime.utcfromtimestamp(r["block_time"]),
-                "token0_balance": t0,
-                "token1_balance": t1,
-            }
+    if lookback_days > SNAPSHOT_MIN_LOOKBACK_DAYS:
+        df = _liquidity_from_snapshots(pool_lower, since_ts)
+        if df is not None:
+            return df
+
+    times, bal0, bal1 = [], [], []
+    # Running balances carried from one chunk into the next
+    t0 = t1 = 0
+
+    with get_conn() as conn:
+        # Stream in chunks so a long lookback never holds every raw text row
+        # at once; only the float64 balances of earlier chunks are kept.
+        chunks = pd.read_sql_query(
+            """
+            SELECT event_type, token0_amount, token1_amount, block_time
+            FROM pool_liquidity_events
+            WHERE pool_address = ? AND block_time >= ?
+            ORDER BY block_time ASC
+            """,
+            conn,
+            params=(pool_lower, since_ts),
+            parse_dates={"block_time": {"unit": "s"}},
+            chunksize=LIQUIDITY_CHUNK_ROWS,
         )
-    return pd.DataFrame(out)
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            # Amounts are uint256 text and can overflow int64, so the signed
+            # running sums use object arrays of Python ints: exact, but still
+            # one C-level cumsum per chunk.
+            sign = np.where(chunk["event_type"].to_numpy() == "ADD", 1, -1).astype(object)
+            cum0 = np.cumsum(sign * chunk["token0_amount"].map(int).to_numpy(dtype=object)) + t0
+            cum1 = np.cumsum(sign * chunk["token1_amount"].map(int).to_numpy(dtype=object)) + t1
+            t0, t1 = cum0[-1], cum1[-1]
+
+            times.append(chunk["block_time"].to_numpy())
+            bal0.append(cum0.astype("float64"))
+            bal1.append(cum1.astype("float64"))
+
+    if not times:
+        return _empty_frame(LIQUIDITY_TS_DTYPES)
+
+    return pd.DataFrame(
+        {
+            "time": np.concatenate(times),
+            "token0_balance": np.concatenate(bal0),
+            "token1_balance": np.concatenate(bal1),
+        }
+    )
 
 
 def get_swap_volume_timeseries(
@@ -190,44 +485,54 @@ def get_swap_volume_timeseries(
     Aggregate swap amounts by hour in *token units* for token0 and token1,
     using real decimals per token.
     """
-    conn = _conn()
-    conn.row_factory = sqlite3.Row
-    cur = conn.cursor()
-
-    since_ts = int((datetime.utcnow() - timedelta(days=lookback_days)).timestamp())
+    since_ts = int(time.time()) - lookback_days * 86400
     pool_lower = pool_address.lower()
 
-    cur.execute(
-        """
-        SELECT amount0_in, amount1_in, amount0_out, amount1_out, block_time
-        FROM pool_swaps
-        WHERE pool_address = ? AND block_time >= ?
-        ORDER BY block_time ASC
-        """,
-        (pool_lower, since_ts),
-    )
-    rows = cur.fetchall()
-    conn.close()
+    # Bucket by hour inside SQLite so only ~24 rows/day cross into Python,
+    # then scale each column once below. The sums stay REAL: swap amounts are
+    # uint256 text and 18-decimal volumes routinely exceed 2**63, where
+    # CAST(... AS INTEGER) saturates and an integer SUM raises on overflow.
+    with get_conn() as conn:
+        df = pd.read_sql_query(
+            """
+            SELECT
+                block_time / 3600 AS hour,
+                SUM(CAST(amount0_in AS REAL) + CAST(amount0_out AS REAL)) AS token0_volume,
+                SUM(CAST(amount1_in AS REAL) + CAST(amount1_out AS REAL)) AS token1_volume
+            FROM pool_swaps
+            WHERE pool_address = ? AND block_time >= ?
+            GROUP BY hour
+            ORDER BY hour ASC
+            """,
+            conn,
+            params=(pool_lower, since_ts),
+            dtype={"hour": "int64", "token0_volume": "float64", "token1_volume": "float64"},
+        )
 
-    if not rows:
-        return pd.DataFrame(columns=["time", "token0_volume", "token1_volume"])
+    if df.empty:
+        return _empty_frame(SWAP_TS_DTYPES)
 
-    # get decimals per token
-    dec0 = get_token_decimals(token0_address)
-    dec1 = get_token_decimals(token1_address)
+    # get decimals per token; a cold cache costs one batched RPC for both
+    dec0, dec1 = get_tokens_decimals([token0_address, token1_address])
     scale0 = 10**dec0
     scale1 = 10**dec1
 
-    records: List[Dict] = []
-    for r in rows:
-        t = datetime.utcfromtimestamp(r["block_time"]).replace(
-            minute=0, second=0, microsecond=0
-        )
-        token0 = (int(r["amount0_in"]) + int(r["amount0_out"])) / scale0
-        token1 = (int(r["amount1_in"]) + int(r["amount1_out"])) / scale1
-        records.append({"time": t, "token0_volume": token0, "token1_volume": token1})
-
-    df = pd.DataFrame(records)
-    df = df.groupby("time", as_index=False)[["token0_volume", "token1_volume"]].sum()
-    return df
-
+    # Hours are dense integers, so bincount scatters the sparse SQL buckets
+    # onto a continuous hourly axis; quiet hours plot as zero instead of the
+    # line interpolating across them.
+    hours = df["hour"].to_numpy()
+    hour_idx = hours - hours[0]
+    n_hours = int(hour_idx[-1]) + 1
+    return pd.DataFrame(
+        {
+            "time": ((hours[0] + np.arange(n_hours)) * 3600).astype("datetime64[s]"),
+            "token0_volume": np.bincount(
+                hour_idx, weights=df["token0_volume"].to_numpy(), minlength=n_hours
+            )
+            / scale0,
+            "token1_volume": np.bincount(
+                hour_idx, weights=df["token1_volume"].to_numpy(), minlength=n_hours
+            )
+            / scale1,
+        }
+    )
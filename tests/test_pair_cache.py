@@ -0,0 +1,73 @@
+"""
+Pair snapshots must survive Streamlit reruns: the app script is re-executed
+as a fresh module each time, so the TTL cache has to live outside it.
+"""
+
+import os
+from unittest import mock
+
+import requests
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "Aerodrome_Base_v4.py")
+POOLS = [
+    "0x9Da64ed1b87b3d0d3d1E731dd3aAAAc08eb0f5C3",
+    "0x80c394f8867e06704d39a5910666a3e71ca7f325",
+    "0xdb6556a14976894a01085c2abf3c85c86d1c15c8",
+]
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, payload: dict):
+        self._payload = payload
+
+    def json(self) -> dict:
+        return self._payload
+
+
+def _pair(address: str) -> dict:
+    # $100/day of volume -> the maximum TTL
+    return {
+        "pairAddress": address,
+        "chainId": "base",
+        "dexId": "aerodrome",
+        "baseToken": {"symbol": "A", "address": "0x4200000000000000000000000000000000000006"},
+        "quoteToken": {"symbol": "B", "address": "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913"},
+        "priceUsd": "1",
+        "liquidity": {"usd": 1, "base": 1, "quote": 1},
+        "volume": {"h24": 100, "h6": 1, "h1": 1},
+        "txns": {},
+    }
+
+
+def test_rerun_within_ttl_makes_no_pair_request(tmp_path, monkeypatch):
+    monkeypatch.setenv("POOL_EVENTS_DB", str(tmp_path / "pool_events.db"))
+    pair_requests = []
+
+    def fake_get(self, url, **kwargs):
+        if "/pairs/" in url:
+            pair_requests.append(url)
+            return _Response({"pairs": [_pair(p) for p in POOLS]})
+        return _Response({"pairs": []})
+
+    def no_rpc(self, *args, **kwargs):
+        raise requests.ConnectionError("RPC disabled in tests")
+
+    with mock.patch.object(requests.Session, "get", fake_get), mock.patch.object(
+        requests.Session, "post", no_rpc
+    ):
+        at = AppTest.from_file(APP_PATH, default_timeout=60)
+        at.run()
+        assert not at.exception
+        assert len(pair_requests) == 1
+
+        # Widget interaction and a plain rerun are both served from cache
+        at.checkbox[0].check().run()
+        at.run()
+        assert len(pair_requests) == 1
+
+        # The refresh button drops the cache
+        next(b for b in at.button if "Refresh" in str(b.label)).click().run()
+        assert len(pair_requests) == 2